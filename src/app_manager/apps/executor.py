@@ -1,29 +1,100 @@
-"""Application executor - runs commands via subprocess."""
+"""Application executor - runs commands via subprocess.
+
+Commands are always spawned from a plain argv list (no shell=True, no
+preexec_fn, inherited environment) so CPython can take its vfork-based
+spawn path, which does not copy the bot's page tables on every launch.
+Keep it that way when adding new commands.
+"""
 
 import asyncio
+import functools
+import os
+import shlex
 import subprocess
+import time
+from collections.abc import Iterable
 from pathlib import Path
+from typing import ClassVar
 
 import structlog
 
 from app_manager.apps.models import AppConfig
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="executor")
 
 # Default timeouts in seconds
 DEFAULT_COMMAND_TIMEOUT = 60
 GIT_PULL_TIMEOUT = 120
 LOG_LINES_DEFAULT = 50
 MAX_OUTPUT_LENGTH = 3500  # Telegram message limit is ~4096, leave room for formatting
+TRUNCATE_HEADER = b"...(truncated)...\n"
+_EMPTY: tuple[str, ...] = ()
+STREAM_CHUNK_SIZE = 8192  # Read size when draining subprocess output
+MAX_CONCURRENT_COMMANDS = 8  # Upper bound on parallel spawns in run_many
+STAT_CACHE_TTL = 2  # Seconds a cached log file existence check stays valid
+
+
+@functools.lru_cache(maxsize=256)
+def _stat_cached(path: str, bucket: int) -> os.stat_result | None:
+    """Stat a path, memoized per time bucket. Returns None if it does not exist."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _path_exists(path: Path) -> bool:
+    """Check path existence, reusing stat results for up to STAT_CACHE_TTL seconds."""
+    return _stat_cached(str(path), int(time.monotonic() // STAT_CACHE_TTL)) is not None
+
+
+def _tail_bytes(path: Path, lines: int, max_bytes: int) -> bytes:
+    """Return the last `lines` lines of a file, reading at most `max_bytes` from its end.
+
+    If the last `max_bytes` bytes hold fewer lines (e.g. a log with very
+    long lines), all of them are returned.
+    """
+    if lines <= 0:
+        return b""
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        offset = max(0, size - max_bytes)
+        os.lseek(fd, offset, os.SEEK_SET)
+        buf = os.read(fd, size - offset)
+    finally:
+        os.close(fd)
+
+    # A trailing newline ends the last line, it does not start a new one
+    end = len(buf) - 1 if buf.endswith(b"\n") else len(buf)
+    parts = buf[:end].rsplit(b"\n", lines)
+    if len(parts) > lines:
+        return b"\n".join(parts[1:]) + buf[end:]
+    return buf
+
+
+async def _read_stream(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Drain a stream until EOF, keeping only the last `limit` bytes."""
+    buf = bytearray()
+    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+        buf += chunk
+        if len(buf) > limit:
+            del buf[:-limit]
+    return bytes(buf)
 
 
 class ExecutionResult:
-    """Result of a command execution."""
+    """Result of a command execution.
+
+    `output` may be raw bytes (log tails are passed through undecoded);
+    use `text` to get it as a string, decoded once on first access.
+    """
 
     def __init__(
         self,
         success: bool,
-        output: str,
+        output: bytes | str,
         return_code: int | None = None,
         error: str | None = None,
     ):
@@ -31,258 +102,206 @@ class ExecutionResult:
         self.output = output
         self.return_code = return_code
         self.error = error
+        self._text: str | None = output if isinstance(output, str) else None
+
+    @property
+    def text(self) -> str:
+        """Get the output as text."""
+        if self._text is None:
+            self._text = self.output.decode("utf-8", errors="replace")
+        return self._text
 
     def __str__(self) -> str:
         if self.success:
-            return self.output
-        return f"Error: {self.error}\n\n{self.output}" if self.output else f"Error: {self.error}"
+            return self.text
+        return f"Error: {self.error}\n\n{self.text}" if self.output else f"Error: {self.error}"
 
 
 class AppExecutor:
     """Execute application management commands via subprocess."""
 
-    def __init__(self, command_timeout: int = DEFAULT_COMMAND_TIMEOUT):
+    # Class-level copies of the module constants, read via self inside methods
+    DEFAULT_TIMEOUT: ClassVar[int] = DEFAULT_COMMAND_TIMEOUT
+    GIT_TIMEOUT: ClassVar[int] = GIT_PULL_TIMEOUT
+    MAX_OUT: ClassVar[int] = MAX_OUTPUT_LENGTH
+
+    def __init__(self, command_timeout: int | None = None):
+        if command_timeout is None:
+            command_timeout = self.DEFAULT_TIMEOUT
         self.command_timeout = command_timeout
 
-    async def run(
+    async def _run_subprocess(
         self,
-        app: AppConfig,
-        action: str,
-        extra_args: list[str] | None = None,
+        argv: list[str],
+        cwd: Path,
+        timeout: int,
+        *,
+        op: str,
+        **log_fields,
     ) -> ExecutionResult:
-        """Run a management script command for an app."""
-        script_path = app.script_path
-        cmd_arg = app.get_command(action)
+        """Run a subprocess and wrap its combined stdout/stderr in an ExecutionResult.
 
-        # Build command
-        cmd = [str(script_path), cmd_arg]
-        if extra_args:
-            cmd.extend(extra_args)
-
-        logger.info(
-            "Executing command",
-            app=app.name,
-            action=action,
-            cmd=" ".join(cmd),
-        )
+        `op` names the operation in log events and error messages; any extra
+        keyword arguments are attached to every log event. Output is cut down
+        to MAX_OUT bytes before decoding, so only the kept tail is ever decoded.
+        """
+        # argv and cwd are passed as-is; they are only rendered if the event is emitted
+        logger.info(f"{op} started", cmd=argv, cwd=cwd, **log_fields)
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(app.path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                env=None,  # Inherit environment
-            )
-
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.command_timeout,
-            )
+            return_code, stdout = await self._spawn(argv, cwd, timeout)
+            output = self._truncate_bytes(stdout).decode("utf-8", errors="replace")
 
-            output = stdout.decode("utf-8", errors="replace")
-            output = self._truncate_output(output)
-
-            success = process.returncode == 0
+            success = return_code == 0
 
             logger.info(
-                "Command completed",
-                app=app.name,
-                action=action,
+                f"{op} completed",
                 success=success,
-                return_code=process.returncode,
+                return_code=return_code,
+                **log_fields,
             )
 
             return ExecutionResult(
                 success=success,
                 output=output,
-                return_code=process.returncode,
+                return_code=return_code,
             )
 
         except asyncio.TimeoutError:
-            logger.error(
-                "Command timed out",
-                app=app.name,
-                action=action,
-                timeout=self.command_timeout,
-            )
+            logger.error(f"{op} timed out", timeout=timeout, **log_fields)
             return ExecutionResult(
                 success=False,
                 output="",
-                error=f"Command timed out after {self.command_timeout} seconds",
+                error=f"{op} timed out after {timeout} seconds",
             )
 
-        except FileNotFoundError:
-            logger.error(
-                "Script not found",
-                app=app.name,
-                script=str(script_path),
-            )
+        except FileNotFoundError as e:
+            # The missing file may be the executable or the working directory
+            missing = e.filename if e.filename is not None else argv[0]
+            logger.error(f"{op} failed, file not found", path=missing, **log_fields)
             return ExecutionResult(
                 success=False,
                 output="",
-                error=f"Script not found: {script_path}",
+                error=f"Script not found: {missing}" if missing == argv[0] else str(e),
             )
 
         except Exception as e:
-            logger.exception(
-                "Command execution failed",
-                app=app.name,
-                action=action,
-            )
+            logger.exception(f"{op} failed", **log_fields)
             return ExecutionResult(
                 success=False,
                 output="",
                 error=str(e),
             )
 
-    async def git_checkout(self, app: AppConfig, branch: str) -> ExecutionResult:
-        """Switch to a different git branch in app directory."""
-        logger.info("Switching branch", app=app.name, branch=branch, path=str(app.path))
-
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "checkout", "--force", branch,
-                cwd=str(app.path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
-
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=GIT_PULL_TIMEOUT,
-            )
-
-            output = stdout.decode("utf-8", errors="replace")
-            success = process.returncode == 0
+    async def _spawn(
+        self,
+        argv: list[str],
+        cwd: Path,
+        timeout: int,
+    ) -> tuple[int, bytes]:
+        """Spawn the command and return (return_code, output)."""
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=str(cwd),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
 
-            logger.info(
-                "Branch switch completed",
-                app=app.name,
-                branch=branch,
-                success=success,
-                return_code=process.returncode,
-            )
+        # Only the tail is ever shown, so cap what is kept in memory (with
+        # headroom for _truncate_bytes to find a line break)
+        limit = self.MAX_OUT * 2
 
-            return ExecutionResult(
-                success=success,
-                output=output,
-                return_code=process.returncode,
-            )
+        async def collect() -> bytes:
+            data = await _read_stream(process.stdout, limit)
+            await process.wait()
+            return data
 
-        except asyncio.TimeoutError:
-            logger.error("Branch switch timed out", app=app.name, branch=branch)
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Branch switch timed out after {GIT_PULL_TIMEOUT} seconds",
-            )
+        stdout = await asyncio.wait_for(collect(), timeout=timeout)
+        return process.returncode, stdout
 
-        except Exception as e:
-            logger.exception("Branch switch failed", app=app.name, branch=branch)
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=str(e),
-            )
+    async def run(
+        self,
+        app: AppConfig,
+        action: str,
+        extra_args: list[str] | None = None,
+    ) -> ExecutionResult:
+        """Run a management script command for an app."""
+        cmd = [*app.get_argv(action), *(extra_args or _EMPTY)]
 
-    async def git_fetch(self, app: AppConfig) -> ExecutionResult:
-        """Run git fetch in app directory."""
-        logger.info("Running git fetch", app=app.name, path=str(app.path))
+        return await self._run_subprocess(
+            cmd,
+            app.path,
+            self.command_timeout,
+            op="Command",
+            app=app.name,
+            action=action,
+        )
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "fetch",
-                cwd=str(app.path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
+    async def run_many(self, apps: Iterable[AppConfig], action: str) -> list[ExecutionResult]:
+        """Run the same action for several apps concurrently.
 
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=GIT_PULL_TIMEOUT,
-            )
+        Results are returned in the order of `apps`. At most
+        MAX_CONCURRENT_COMMANDS processes are spawned at once.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
 
-            output = stdout.decode("utf-8", errors="replace")
-            success = process.returncode == 0
+        async def run_one(app: AppConfig) -> ExecutionResult:
+            async with semaphore:
+                return await self.run(app, action)
 
-            logger.info(
-                "Git fetch completed",
-                app=app.name,
-                success=success,
-                return_code=process.returncode,
-            )
+        return await asyncio.gather(*(run_one(app) for app in apps))
 
-            return ExecutionResult(
-                success=success,
-                output=output,
-                return_code=process.returncode,
-            )
-
-        except asyncio.TimeoutError:
-            logger.error("Git fetch timed out", app=app.name)
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Git fetch timed out after {GIT_PULL_TIMEOUT} seconds",
-            )
+    async def git_checkout(self, app: AppConfig, branch: str) -> ExecutionResult:
+        """Switch to a different git branch in app directory."""
+        return await self._run_subprocess(
+            ["git", "checkout", "--force", branch],
+            app.path,
+            self.GIT_TIMEOUT,
+            op="Branch switch",
+            app=app.name,
+            branch=branch,
+        )
 
-        except Exception as e:
-            logger.exception("Git fetch failed", app=app.name)
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=str(e),
-            )
+    async def git_fetch(self, app: AppConfig) -> ExecutionResult:
+        """Run git fetch in app directory."""
+        return await self._run_subprocess(
+            ["git", "fetch"],
+            app.path,
+            self.GIT_TIMEOUT,
+            op="Git fetch",
+            app=app.name,
+        )
 
     async def git_pull(self, app: AppConfig) -> ExecutionResult:
         """Run git pull in app directory."""
-        logger.info("Running git pull", app=app.name, path=str(app.path))
-
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "pull", "--stat",
-                cwd=str(app.path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
-
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=GIT_PULL_TIMEOUT,
-            )
-
-            output = stdout.decode("utf-8", errors="replace")
-            success = process.returncode == 0
-
-            logger.info(
-                "Git pull completed",
-                app=app.name,
-                success=success,
-                return_code=process.returncode,
-            )
+        return await self._run_subprocess(
+            ["git", "pull", "--stat"],
+            app.path,
+            self.GIT_TIMEOUT,
+            op="Git pull",
+            app=app.name,
+        )
 
-            return ExecutionResult(
-                success=success,
-                output=output,
-                return_code=process.returncode,
-            )
+    async def git_sequence(self, repo_dir: Path, steps: list[list[str]]) -> ExecutionResult:
+        """Run several git commands in a single shell, stopping at the first failure.
 
-        except asyncio.TimeoutError:
-            logger.error("Git pull timed out", app=app.name)
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Git pull timed out after {GIT_PULL_TIMEOUT} seconds",
-            )
+        Each step is an argv list; steps are shell-quoted and chained with
+        `&&` so the whole sequence costs one process spawn.
+        """
+        script = " && ".join(shlex.join(step) for step in steps)
+        return await self._run_subprocess(
+            ["bash", "-c", script],
+            repo_dir,
+            self.GIT_TIMEOUT,
+            op="Git sequence",
+        )
 
-        except Exception as e:
-            logger.exception("Git pull failed", app=app.name)
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=str(e),
-            )
+    async def git_fetch_and_pull(self, app: AppConfig) -> ExecutionResult:
+        """Run git fetch followed by git pull in app directory as one process."""
+        return await self.git_sequence(
+            app.path,
+            [["git", "fetch"], ["git", "pull", "--stat"]],
+        )
 
     async def get_logs(
         self,
@@ -291,7 +310,7 @@ class AppExecutor:
         lines: int = LOG_LINES_DEFAULT,
     ) -> ExecutionResult:
         """Read recent log lines from log file."""
-        log_file = Path(app.log_backend if service == "backend" else app.log_frontend)
+        log_file = app.log_backend_path if service == "backend" else app.log_frontend_path
 
         logger.info(
             "Reading logs",
@@ -301,7 +320,7 @@ class AppExecutor:
             lines=lines,
         )
 
-        if not log_file.exists():
+        if not _path_exists(log_file):
             return ExecutionResult(
                 success=False,
                 output="",
@@ -309,24 +328,14 @@ class AppExecutor:
             )
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                "tail", "-n", str(lines), str(log_file),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
-
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=10,
+            # Bound the read like _spawn bounds its buffer; _truncate_bytes trims the rest
+            data = await asyncio.to_thread(
+                _tail_bytes, log_file, lines, max_bytes=self.MAX_OUT * 2
             )
 
-            output = stdout.decode("utf-8", errors="replace")
-            output = self._truncate_output(output)
-
             return ExecutionResult(
                 success=True,
-                output=output,
-                return_code=process.returncode,
+                output=self._truncate_bytes(data),
             )
 
         except Exception as e:
@@ -337,20 +346,23 @@ class AppExecutor:
                 error=str(e),
             )
 
-    def _truncate_output(self, output: str) -> str:
-        """Truncate output to fit Telegram message limits."""
-        if len(output) <= MAX_OUTPUT_LENGTH:
-            return output
+    def _truncate_bytes(self, buf: bytes) -> bytes:
+        """Truncate raw output to fit Telegram message limits.
+
+        Works on bytes so that only the kept tail needs to be decoded.
+        """
+        if len(buf) <= self.MAX_OUT:
+            return buf
 
         # Keep the end of the output (most recent/relevant)
-        truncated = output[-MAX_OUTPUT_LENGTH:]
+        truncated = buf[-self.MAX_OUT:]
 
         # Find first newline to avoid cutting mid-line
-        first_newline = truncated.find("\n")
+        first_newline = truncated.find(b"\n")
         if first_newline > 0:
             truncated = truncated[first_newline + 1:]
 
-        return f"...(truncated)...\n{truncated}"
+        return TRUNCATE_HEADER + truncated
 
     async def read_log_file(
         self,
@@ -360,7 +372,7 @@ class AppExecutor:
         """Read recent log lines from any log file."""
         logger.info("Reading log file", log_file=str(log_path), lines=lines)
 
-        if not log_path.exists():
+        if not _path_exists(log_path):
             return ExecutionResult(
                 success=False,
                 output="",
@@ -368,24 +380,13 @@ class AppExecutor:
             )
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                "tail", "-n", str(lines), str(log_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
-
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=10,
+            data = await asyncio.to_thread(
+                _tail_bytes, log_path, lines, max_bytes=self.MAX_OUT * 2
             )
 
-            output = stdout.decode("utf-8", errors="replace")
-            output = self._truncate_output(output)
-
             return ExecutionResult(
                 success=True,
-                output=output,
-                return_code=process.returncode,
+                output=self._truncate_bytes(data),
             )
 
         except Exception as e:
@@ -398,67 +399,34 @@ class AppExecutor:
 
     async def git_reset(self, repo_dir: Path, commits: int = 1) -> ExecutionResult:
         """Reset git repo by X commits (git reset --hard HEAD~X)."""
-        logger.info("Resetting git repo", repo_dir=str(repo_dir), commits=commits)
-
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "reset", "--hard", f"HEAD~{commits}",
-                cwd=str(repo_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
-
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=GIT_PULL_TIMEOUT,
-            )
-
-            output = stdout.decode("utf-8", errors="replace")
-            success = process.returncode == 0
-
-            logger.info(
-                "Git reset completed",
-                repo_dir=str(repo_dir),
-                commits=commits,
-                success=success,
-                return_code=process.returncode,
-            )
-
-            return ExecutionResult(
-                success=success,
-                output=output,
-                return_code=process.returncode,
-            )
-
-        except asyncio.TimeoutError:
-            logger.error("Git reset timed out", repo_dir=str(repo_dir))
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Git reset timed out after {GIT_PULL_TIMEOUT} seconds",
-            )
-
-        except Exception as e:
-            logger.exception("Git reset failed", repo_dir=str(repo_dir))
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=str(e),
-            )
+        return await self._run_subprocess(
+            ["git", "reset", "--hard", f"HEAD~{commits}"],
+            repo_dir,
+            self.GIT_TIMEOUT,
+            op="Git reset",
+            commits=commits,
+        )
 
-    def self_restart(self, script_path: Path) -> None:
+    async def self_restart(self, script_path: Path) -> None:
         """Trigger a self-restart via detached subprocess.
 
         Spawns a background process that waits 2 seconds, then calls
         the restart script. This allows the current process to exit
         gracefully while ensuring a new instance starts.
+
+        The helper is a plain Popen (spawned on a worker thread) rather than
+        an asyncio subprocess: an asyncio transport would kill the helper
+        when it is garbage-collected during shutdown, i.e. exactly when
+        run.sh stops this bot, and the new instance would never start.
         """
         logger.info("Triggering self-restart", script=str(script_path))
 
         # Spawn detached process: sleep 2 && /path/to/run.sh restart
-        subprocess.Popen(
-            ["bash", "-c", f"sleep 2 && {script_path} restart"],
+        await asyncio.to_thread(
+            subprocess.Popen,
+            ["bash", "-c", f"sleep 2 && {shlex.quote(str(script_path))} restart"],
             start_new_session=True,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -471,50 +439,10 @@ class AppExecutor:
         """
         logger.info("Self-updating bot", bot_dir=str(bot_dir))
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "pull", "--stat",
-                cwd=str(bot_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-            )
+        result = await self.git_sequence(bot_dir, [["git", "pull", "--stat"]])
 
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=GIT_PULL_TIMEOUT,
-            )
+        if result.success:
+            # Trigger restart after successful pull
+            await self.self_restart(script_path)
 
-            output = stdout.decode("utf-8", errors="replace")
-            success = process.returncode == 0
-
-            logger.info(
-                "Self-update git pull completed",
-                success=success,
-                return_code=process.returncode,
-            )
-
-            if success:
-                # Trigger restart after successful pull
-                self.self_restart(script_path)
-
-            return ExecutionResult(
-                success=success,
-                output=output,
-                return_code=process.returncode,
-            )
-
-        except asyncio.TimeoutError:
-            logger.error("Self-update git pull timed out")
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=f"Git pull timed out after {GIT_PULL_TIMEOUT} seconds",
-            )
-
-        except Exception as e:
-            logger.exception("Self-update failed")
-            return ExecutionResult(
-                success=False,
-                output="",
-                error=str(e),
-            )
+        return result
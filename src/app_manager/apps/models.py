@@ -1,10 +1,14 @@
 """Application configuration models."""
 
+import os
+import stat
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Configuration for a managed application."""
 
@@ -25,30 +29,63 @@ class AppConfig:
     log_backend: str = "/tmp/bot.log"
     log_frontend: str = "/tmp/frontend.log"
 
+    # Derived in __post_init__ - full path to the management script, log
+    # file paths, the action -> command argument table and the full argv
+    # for each action
+    script_path: Path = field(init=False, repr=False, compare=False)
+    log_backend_path: Path = field(init=False, repr=False, compare=False)
+    log_frontend_path: Path = field(init=False, repr=False, compare=False)
+    _cmd_map: Mapping[str, str] = field(init=False, repr=False, compare=False)
+    _argv: Mapping[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Ensure path is a Path object."""
+        """Ensure path is a Path object and precompute derived lookups."""
         if isinstance(self.path, str):
             self.path = Path(self.path)
 
-    @property
-    def script_path(self) -> Path:
-        """Get full path to the management script."""
-        return self.path / self.script
+        self.script_path = self.path / self.script
+        self.log_backend_path = Path(self.log_backend)
+        self.log_frontend_path = Path(self.log_frontend)
+        # Read-only views: the tables are fixed once the config is built
+        self._cmd_map = MappingProxyType({
+            "start": self.cmd_start,
+            "stop": self.cmd_stop,
+            "restart": self.cmd_restart,
+            "status": self.cmd_status,
+            "logs": self.cmd_logs,
+            "build": self.cmd_build,
+        })
+
+        script = str(self.script_path)
+        self._argv = MappingProxyType(
+            {action: (script, cmd) for action, cmd in self._cmd_map.items()}
+        )
 
     def get_command(self, action: str) -> str:
         """Get the command argument for an action."""
-        cmd_attr = f"cmd_{action}"
-        return getattr(self, cmd_attr, action)
+        return self._cmd_map.get(action, action)
+
+    def get_argv(self, action: str) -> tuple[str, ...]:
+        """Get the full script argv for an action."""
+        argv = self._argv.get(action)
+        if argv is None:
+            return (str(self.script_path), action)
+        return argv
 
     def validate(self) -> tuple[bool, str]:
         """Validate the app configuration."""
-        if not self.path.exists():
+        # One stat per path; the script's mode is reused for the file check
+        try:
+            os.stat(self.path)
+        except OSError:
             return False, f"App path does not exist: {self.path}"
 
-        if not self.script_path.exists():
+        try:
+            script_stat = os.stat(self.script_path)
+        except OSError:
             return False, f"Script does not exist: {self.script_path}"
 
-        if not self.script_path.is_file():
+        if not stat.S_ISREG(script_stat.st_mode):
             return False, f"Script is not a file: {self.script_path}"
 
         return True, "OK"
@@ -1,14 +1,26 @@
 """Application registry for managing multiple apps."""
 
+import asyncio
+import dataclasses
 from pathlib import Path
+from typing import Callable
 
 import structlog
 import yaml
 
 from app_manager.apps.models import AppConfig
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = structlog.get_logger()
 
+# Keys accepted per app in apps.yaml; AppConfig supplies defaults for the rest
+_APP_KEYS = frozenset(f.name for f in dataclasses.fields(AppConfig) if f.init)
+
 
 class AppNotFoundError(Exception):
     """Raised when an app is not found in the registry."""
@@ -22,40 +34,46 @@ class AppRegistry:
     def __init__(self):
         self.apps: dict[str, AppConfig] = {}
         self.default_app: str | None = None
+        # Bumped whenever the registered apps change, so callers can cache
+        # values derived from them
+        self.version: int = 0
+        self._change_listeners: list[Callable[[], None]] = []
 
-    def load_from_yaml(self, config_path: str | Path) -> None:
-        """Load apps from YAML configuration file."""
-        config_path = Path(config_path)
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback run whenever the registered apps change."""
+        self._change_listeners.append(callback)
 
+    def _parse_yaml(self, config_path: Path) -> tuple[str | None, list[AppConfig]]:
+        """Parse the YAML config into the default app name and unvalidated apps."""
         if not config_path.exists():
             raise FileNotFoundError(f"Apps config file not found: {config_path}")
 
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
         if not config:
             raise ValueError("Empty apps configuration file")
 
-        self.default_app = config.get("default_app")
-
+        apps = []
         for app_data in config.get("apps", []):
-            app = AppConfig(
-                name=app_data["name"],
-                path=Path(app_data["path"]),
-                script=app_data.get("script", "scripts/dev.sh"),
-                description=app_data.get("description", ""),
-                cmd_start=app_data.get("cmd_start", "start"),
-                cmd_stop=app_data.get("cmd_stop", "stop"),
-                cmd_restart=app_data.get("cmd_restart", "restart"),
-                cmd_status=app_data.get("cmd_status", "status"),
-                cmd_logs=app_data.get("cmd_logs", "logs"),
-                cmd_build=app_data.get("cmd_build", "build"),
-                log_backend=app_data.get("log_backend", "/tmp/bot.log"),
-                log_frontend=app_data.get("log_frontend", "/tmp/frontend.log"),
-            )
+            # Unknown keys are ignored rather than passed through to AppConfig
+            cfg = {k: v for k, v in app_data.items() if k in _APP_KEYS}
+            cfg["path"] = Path(cfg["path"])
+            apps.append(AppConfig(**cfg))
+
+        return config.get("default_app"), apps
+
+    async def load_from_yaml_async(self, config_path: str | Path) -> None:
+        """Load apps from YAML configuration file, validating all apps concurrently."""
+        config_path = Path(config_path)
+
+        default_app, apps = await asyncio.to_thread(self._parse_yaml, config_path)
+        self.default_app = default_app
 
-            # Validate app configuration
-            is_valid, error_msg = app.validate()
+        # Each validate() stats the filesystem; run them in parallel
+        results = await asyncio.gather(*(asyncio.to_thread(app.validate) for app in apps))
+
+        for app, (is_valid, error_msg) in zip(apps, results):
             if not is_valid:
                 logger.warning(
                     "Invalid app configuration",
@@ -74,6 +92,18 @@ class AppRegistry:
             self.default_app = next(iter(self.apps.keys()))
             logger.info("Using first app as default", default_app=self.default_app)
 
+        self.version += 1
+        for callback in self._change_listeners:
+            callback()
+
+    def load_from_yaml(self, config_path: str | Path) -> None:
+        """Load apps from YAML configuration file.
+
+        Blocking wrapper around load_from_yaml_async; must not be called
+        from inside a running event loop.
+        """
+        asyncio.run(self.load_from_yaml_async(config_path))
+
     def get(self, name: str | None = None) -> AppConfig:
         """Get app by name or return default."""
         if name is None:
@@ -88,7 +118,11 @@ class AppRegistry:
         return self.apps[name]
 
     def list_apps(self) -> list[AppConfig]:
-        """List all registered apps."""
+        """List all registered apps.
+
+        To run an action across all of them, prefer AppExecutor.run_many
+        over awaiting AppExecutor.run in a loop.
+        """
         return list(self.apps.values())
 
     def get_app_names(self) -> list[str]:
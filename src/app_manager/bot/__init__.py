@@ -1,6 +1,6 @@
 """Bot module - Telegram bot handlers and utilities."""
 
-from app_manager.bot.auth import require_admin, require_auth
+from app_manager.bot.auth import configure_auth_logging, require_admin, require_auth
 from app_manager.bot.handlers import BotHandlers
 
-__all__ = ["BotHandlers", "require_auth", "require_admin"]
+__all__ = ["BotHandlers", "configure_auth_logging", "require_auth", "require_admin"]
@@ -1,94 +1,147 @@
 """Authorization decorators for bot commands."""
 
-from functools import wraps
+from functools import update_wrapper
 from typing import Callable
 
 import structlog
 from telegram import Update
 from telegram.ext import ContextTypes
 
-logger = structlog.get_logger()
-
-
-def require_auth(func: Callable) -> Callable:
-    """Decorator requiring user to be authorized (admin or whitelist)."""
-
-    @wraps(func)
-    async def wrapper(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-    ):
-        try:
+# Context is passed to get_logger() rather than bound here: binding at import
+# would resolve the logger before setup_logging() configures structlog.
+logger = structlog.get_logger(component="auth")
+
+# Module switches for the per-command log events, set by configure_auth_logging()
+# at startup so the hot path checks a global instead of building event kwargs
+_DEBUG_ENABLED = False
+_AUDIT_ENABLED = True
+
+
+def configure_auth_logging(debug: bool, audit: bool) -> None:
+    """Enable or disable the auth debug and audit log events."""
+    global _DEBUG_ENABLED, _AUDIT_ENABLED
+    _DEBUG_ENABLED = debug
+    _AUDIT_ENABLED = audit
+
+
+class _AuthGate:
+    """Method descriptor that checks authorization before running a handler.
+
+    On first access through an instance, __get__ builds a coroutine function
+    with the check inlined and stores it in the instance __dict__, so later
+    lookups (and each command dispatch) skip the descriptor entirely.
+    """
+
+    def __init__(self, func: Callable, admin_only: bool = False):
+        self.func = func
+        self.admin_only = admin_only
+        self.name = func.__name__
+        update_wrapper(self, func)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        gate = self._bind_admin(instance) if self.admin_only else self._bind_auth(instance)
+        update_wrapper(gate, self.func)
+        instance.__dict__[self.name] = gate
+        return gate
+
+    def _bind_auth(self, instance) -> Callable:
+        func = self.func
+        settings = instance.settings
+        # Read once per instance; the gate only does a frozenset membership test
+        authorized_ids = settings.all_authorized_users
+
+        async def gate(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            try:
+                user = update.effective_user
+                if not user:
+                    logger.warning("No effective user in update")
+                    return
+
+                user_id = user.id
+                username = user.username
+                message = update.message
+                command_text = message.text if message else None
+
+                is_authorized = user_id in authorized_ids
+
+                if _DEBUG_ENABLED:
+                    logger.debug(
+                        "Auth check",
+                        user_id=user_id,
+                        admin_ids=settings.admin_ids,
+                        is_authorized=is_authorized,
+                    )
+
+                if not is_authorized:
+                    logger.warning(
+                        "Unauthorized access attempt",
+                        user_id=user_id,
+                        username=username,
+                        command=command_text,
+                    )
+                    return  # Silent - no response to unauthorized users
+
+                if _AUDIT_ENABLED:
+                    logger.info(
+                        "Authorized command",
+                        user_id=user_id,
+                        username=username,
+                        command=command_text,
+                    )
+
+                return await func(instance, update, context, *args, **kwargs)
+            except Exception:
+                logger.exception("Error in auth decorator")
+                raise
+
+        return gate
+
+    def _bind_admin(self, instance) -> Callable:
+        func = self.func
+        admin_ids = instance.settings.admin_ids
+
+        async def gate(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
             user = update.effective_user
             if not user:
-                logger.warning("No effective user in update")
                 return
 
             user_id = user.id
+            username = user.username
+            message = update.message
+            command_text = message.text if message else None
 
-            logger.debug(
-                "Auth check",
-                user_id=user_id,
-                admin_ids=self.settings.admin_ids,
-                is_authorized=self.settings.is_authorized(user_id),
-            )
-
-            if not self.settings.is_authorized(user_id):
+            if user_id not in admin_ids:
                 logger.warning(
-                    "Unauthorized access attempt",
+                    "Non-admin attempted admin command",
                     user_id=user_id,
-                    username=user.username,
-                    command=update.message.text if update.message else None,
+                    username=username,
+                    command=command_text,
                 )
-                return  # Silent - no response to unauthorized users
+                return  # Silent - no response to non-admins
 
-            logger.info(
-                "Authorized command",
-                user_id=user_id,
-                username=user.username,
-                command=update.message.text if update.message else None,
-            )
+            if _AUDIT_ENABLED:
+                logger.info(
+                    "Admin command executed",
+                    user_id=user_id,
+                    username=username,
+                    command=command_text,
+                )
+
+            return await func(instance, update, context, *args, **kwargs)
+
+        return gate
 
-            return await func(self, update, context)
-        except Exception as e:
-            logger.exception("Error in auth decorator", error=str(e))
-            raise
 
-    return wrapper
+def require_auth(func: Callable) -> Callable:
+    """Decorator requiring user to be authorized (admin or whitelist)."""
+    return _AuthGate(func)
 
 
 def require_admin(func: Callable) -> Callable:
     """Decorator requiring user to be an admin."""
-
-    @wraps(func)
-    async def wrapper(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-    ):
-        user = update.effective_user
-        if not user:
-            return
-
-        user_id = user.id
-
-        if not self.settings.is_admin(user_id):
-            logger.warning(
-                "Non-admin attempted admin command",
-                user_id=user_id,
-                username=user.username,
-                command=update.message.text if update.message else None,
-            )
-            return  # Silent - no response to non-admins
-
-        logger.info(
-            "Admin command executed",
-            user_id=user_id,
-            username=user.username,
-            command=update.message.text if update.message else None,
-        )
-
-        return await func(self, update, context)
-
-    return wrapper
+    return _AuthGate(func, admin_only=True)
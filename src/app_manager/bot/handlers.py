@@ -1,15 +1,135 @@
 """Telegram bot command handlers."""
 
+import asyncio
+import time
+from collections import defaultdict
+from collections.abc import Awaitable
+from functools import partial, partialmethod
+
 import structlog
-from telegram import Update
+from telegram import Message, Update
+from telegram.constants import MessageLimit, ParseMode
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
-from app_manager.apps import AppExecutor, AppRegistry
+from app_manager.apps import AppConfig, AppExecutor, AppRegistry
+from app_manager.apps.executor import TRUNCATE_HEADER, ExecutionResult
 from app_manager.apps.registry import AppNotFoundError
 from app_manager.bot.auth import require_admin, require_auth
 from app_manager.config import Settings
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="handlers")
+
+_MD = ParseMode.MARKDOWN
+
+# Shared stand-in for a command sent without arguments
+_EMPTY_ARGS: tuple[str, ...] = ()
+
+# Sent as plain text, so Telegram has no entities to parse
+_HELP_TEXT = """Application Manager Bot
+
+Basic Commands:
+/start - Welcome message
+/help - Show this help
+/apps - List managed applications
+
+Application Management:
+/status [app] - Show application status
+/app_start [app] - Start application
+/app_stop [app] - Stop application
+/app_restart [app] - Restart application
+/logs [app] [backend|frontend] - Show recent logs
+/build [app] - Build application
+
+Admin Commands:
+/update [app] - Git pull and restart (admin only)
+/branch <branch> [app] - Switch git branch (admin only)
+/rollback <n> [app] - Reset n commits and restart (admin only)
+/self_rollback <n> - Reset n commits on this bot (admin only)
+/self_logs - Show this bot's logs (admin only)
+/self_restart - Restart this bot (admin only)
+/self_update - Update and restart this bot (admin only)
+
+Note: If [app] is omitted, the default app is used.
+"""
+
+_WELCOME_TEMPLATE = (
+    "Hello {name}!\n\n"
+    "I'm the Application Manager Bot.\n"
+    "I can help you manage your applications.\n\n"
+    "Use /help to see available commands.\n"
+    "Use /apps to list managed applications."
+)
+
+# Final message of the app and git commands; filled with _format_result()
+_RESULT_TEMPLATE = "{icon} *{verb}: {name}*\n\n```\n{result}\n```"
+# Same marker the executor puts in front of truncated command output
+_TRUNCATED_MARKER = TRUNCATE_HEADER.decode()
+
+# Services accepted as the trailing /logs argument
+_SERVICES = frozenset(("backend", "frontend"))
+
+
+def _truncate_for_telegram(text: str, limit: int) -> str:
+    """Keep the tail of text, marked as truncated, within limit characters."""
+    if len(text) <= limit:
+        return text
+    keep = max(limit - len(_TRUNCATED_MARKER), 0)
+    return _TRUNCATED_MARKER + text[len(text) - keep:]
+
+
+def _format_result(success: bool, verb: str, name: str, result: object) -> str:
+    """Render _RESULT_TEMPLATE, trimming the result to fit one Telegram message."""
+    fields = {"icon": "✅" if success else "❌", "verb": verb, "name": name, "result": str(result)}
+    text = _RESULT_TEMPLATE.format_map(fields)
+    excess = len(text) - MessageLimit.MAX_TEXT_LENGTH
+    if excess > 0:
+        fields["result"] = _truncate_for_telegram(fields["result"], len(fields["result"]) - excess)
+        text = _RESULT_TEMPLATE.format_map(fields)
+    return text
+
+
+async def _edit_while(
+    progress: Message,
+    text: str,
+    work: Awaitable[ExecutionResult],
+) -> ExecutionResult:
+    """Edit a progress message while `work` runs, and return work's result.
+
+    The work is started first and always awaited; a failed edit (flood
+    control, unchanged text, ...) is logged instead of abandoning it.
+    """
+    task = asyncio.ensure_future(work)
+    try:
+        await progress.edit_text(text, parse_mode=_MD)
+    except TelegramError as e:
+        logger.warning("Progress edit failed", error=str(e))
+    return await task
+
+
+async def _finish_ack(
+    ack: asyncio.Task[Message],
+    message: Message,
+    text: str,
+    parse_mode: ParseMode | None = None,
+) -> None:
+    """Edit the final text into an ack that was sent while the work ran.
+
+    If the ack itself failed (flood control, network, ...), the text is sent
+    as a new reply instead, so the user still gets the result.
+    """
+    try:
+        progress = await ack
+    except TelegramError as e:
+        logger.warning("Progress ack failed", error=str(e))
+        await message.reply_text(text, parse_mode=parse_mode)
+        return
+    await progress.edit_text(text, parse_mode=parse_mode)
+
+
+async def _md_reply(message: Message, text: str) -> Message:
+    """Reply to a message with Markdown formatting."""
+    return await message.reply_text(text, parse_mode=_MD)
 
 
 class BotHandlers:
@@ -24,6 +144,16 @@ class BotHandlers:
         self.settings = settings
         self.app_registry = app_registry
         self.executor = executor or AppExecutor()
+        # Rendered /apps text, dropped whenever the registry reloads
+        self._app_list_cache: str | None = None
+        app_registry.add_change_listener(self.invalidate_app_list_cache)
+        # app name -> (expiry, in-flight or finished status run)
+        self._status_cache: dict[str, tuple[float, asyncio.Future[ExecutionResult]]] = {}
+        # Updates are handled concurrently, so commands that change an app's
+        # working tree or process state are serialized per app, and the
+        # self_* commands bot-wide
+        self._app_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._self_lock = asyncio.Lock()
 
     def _get_app_name(self, args: list[str] | None) -> str | None:
         """Extract app name from command arguments."""
@@ -31,8 +161,44 @@ class BotHandlers:
             return args[0]
         return None
 
+    def invalidate_app_list_cache(self) -> None:
+        """Drop the cached /apps text so it is rebuilt on next use."""
+        self._app_list_cache = None
+
+    async def _get_status(self, app: AppConfig) -> ExecutionResult:
+        """Run the status action, sharing one run among calls within the TTL."""
+        ttl = self.settings.status_cache_ttl
+        if ttl <= 0:
+            return await self.executor.run(app, "status")
+
+        now = time.monotonic()
+        entry = self._status_cache.get(app.name)
+        if entry and entry[0] > now:
+            future = entry[1]
+        else:
+            future = asyncio.ensure_future(self.executor.run(app, "status"))
+            self._status_cache[app.name] = (now + ttl, future)
+            future.add_done_callback(partial(self._evict_failed_status, app.name))
+
+        # Shielded: cancelling one waiting handler must not cancel the shared run
+        return await asyncio.shield(future)
+
+    def _evict_failed_status(self, app_name: str, future: asyncio.Future) -> None:
+        """Drop a shared status run that was cancelled or raised, so it is not reused."""
+        if future.cancelled() or future.exception() is not None:
+            entry = self._status_cache.get(app_name)
+            if entry and entry[1] is future:
+                del self._status_cache[app_name]
+
+    def _invalidate_status(self, app_name: str) -> None:
+        """Forget the cached status of an app whose state was just changed."""
+        self._status_cache.pop(app_name, None)
+
     def _format_app_list(self) -> str:
-        """Format list of available apps."""
+        """Format list of available apps, cached until the registry changes."""
+        if self._app_list_cache is not None:
+            return self._app_list_cache
+
         apps = self.app_registry.list_apps()
         lines = ["*Available Applications:*\n"]
 
@@ -42,79 +208,19 @@ class BotHandlers:
             if app.description:
                 lines.append(f"    {app.description}")
 
-        return "\n".join(lines)
-
-    @require_auth
-    async def start_command(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-    ) -> None:
-        """Handle /start command - welcome message."""
-        user = update.effective_user
-        welcome = (
-            f"Hello {user.first_name}!\n\n"
-            "I'm the Application Manager Bot.\n"
-            "I can help you manage your applications.\n\n"
-            "Use /help to see available commands.\n"
-            "Use /apps to list managed applications."
-        )
-        await update.message.reply_text(welcome)
-
-    @require_auth
-    async def help_command(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-    ) -> None:
-        """Handle /help command - show available commands."""
-        help_text = """*Application Manager Bot*
-
-*Basic Commands:*
-/start - Welcome message
-/help - Show this help
-/apps - List managed applications
-
-*Application Management:*
-/status [app] - Show application status
-/app\\_start [app] - Start application
-/app\\_stop [app] - Stop application
-/app\\_restart [app] - Restart application
-/logs [app] [backend|frontend] - Show recent logs
-/build [app] - Build application
-
-*Admin Commands:*
-/update [app] - Git pull and restart (admin only)
-/branch <branch> [app] - Switch git branch (admin only)
-/rollback <n> [app] - Reset n commits and restart (admin only)
-/self\\_rollback <n> - Reset n commits on this bot (admin only)
-/self\\_logs - Show this bot's logs (admin only)
-/self\\_restart - Restart this bot (admin only)
-/self\\_update - Update and restart this bot (admin only)
-
-_Note: If [app] is omitted, the default app is used._
-"""
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        self._app_list_cache = "\n".join(lines)
+        return self._app_list_cache
 
     @require_auth
-    async def apps_command(
+    async def _run_app_action(
         self,
         update: Update,
         context: ContextTypes.DEFAULT_TYPE,
+        action: str,
+        verb_present: str,
+        verb_past: str,
     ) -> None:
-        """Handle /apps command - list managed applications."""
-        await update.message.reply_text(
-            self._format_app_list(),
-            parse_mode="Markdown",
-        )
-
-    @require_auth
-    async def status_command(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-    ) -> None:
-        """Handle /status command - show application status."""
+        """Run a simple script action for the app named in the command args."""
         app_name = self._get_app_name(context.args)
 
         try:
@@ -123,90 +229,71 @@ _Note: If [app] is omitted, the default app is used._
             await update.message.reply_text(f"Error: {e}")
             return
 
-        await update.message.reply_text(f"Checking status of `{app.name}`...", parse_mode="Markdown")
-
-        result = await self.executor.run(app, "status")
-
-        status_icon = "✅" if result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Status: {app.name}*\n\n```\n{result}\n```",
-            parse_mode="Markdown",
+        # Send the ack while the script runs, then edit the result into it
+        ack = asyncio.create_task(update.message.reply_text(f"{verb_present} {app.name}..."))
+        try:
+            if action == "status":
+                result = await self._get_status(app)
+            else:
+                async with self._app_locks[app.name]:
+                    result = await self.executor.run(app, action)
+                self._invalidate_status(app.name)
+        except BaseException:
+            ack.cancel()
+            raise
+
+        await _finish_ack(
+            ack,
+            update.message,
+            _format_result(result.success, verb_past, app.name, result),
+            _MD,
         )
 
+    # Simple app commands: /status, /app_start, /app_stop, /app_restart, /build
+    status_command = partialmethod(
+        _run_app_action, action="status", verb_present="Checking status of", verb_past="Status"
+    )
+    app_start_command = partialmethod(
+        _run_app_action, action="start", verb_present="Starting", verb_past="Start"
+    )
+    app_stop_command = partialmethod(
+        _run_app_action, action="stop", verb_present="Stopping", verb_past="Stop"
+    )
+    app_restart_command = partialmethod(
+        _run_app_action, action="restart", verb_present="Restarting", verb_past="Restart"
+    )
+    build_command = partialmethod(
+        _run_app_action, action="build", verb_present="Building", verb_past="Build"
+    )
+
     @require_auth
-    async def app_start_command(
+    async def start_command(
         self,
         update: Update,
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
-        """Handle /app_start command - start application."""
-        app_name = self._get_app_name(context.args)
-
-        try:
-            app = self.app_registry.get(app_name)
-        except AppNotFoundError as e:
-            await update.message.reply_text(f"Error: {e}")
-            return
-
-        await update.message.reply_text(f"Starting `{app.name}`...", parse_mode="Markdown")
-
-        result = await self.executor.run(app, "start")
-
-        status_icon = "✅" if result.success else "❌"
+        """Handle /start command - welcome message."""
         await update.message.reply_text(
-            f"{status_icon} *Start: {app.name}*\n\n```\n{result}\n```",
-            parse_mode="Markdown",
+            _WELCOME_TEMPLATE.format(name=update.effective_user.first_name)
         )
 
     @require_auth
-    async def app_stop_command(
+    async def help_command(
         self,
         update: Update,
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
-        """Handle /app_stop command - stop application."""
-        app_name = self._get_app_name(context.args)
-
-        try:
-            app = self.app_registry.get(app_name)
-        except AppNotFoundError as e:
-            await update.message.reply_text(f"Error: {e}")
-            return
-
-        await update.message.reply_text(f"Stopping `{app.name}`...", parse_mode="Markdown")
-
-        result = await self.executor.run(app, "stop")
-
-        status_icon = "✅" if result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Stop: {app.name}*\n\n```\n{result}\n```",
-            parse_mode="Markdown",
-        )
+        """Handle /help command - show available commands."""
+        await update.message.reply_text(_HELP_TEXT)
 
     @require_auth
-    async def app_restart_command(
+    async def apps_command(
         self,
         update: Update,
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
-        """Handle /app_restart command - restart application."""
-        app_name = self._get_app_name(context.args)
-
-        try:
-            app = self.app_registry.get(app_name)
-        except AppNotFoundError as e:
-            await update.message.reply_text(f"Error: {e}")
-            return
-
-        await update.message.reply_text(f"Restarting `{app.name}`...", parse_mode="Markdown")
-
-        result = await self.executor.run(app, "restart")
-
-        status_icon = "✅" if result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Restart: {app.name}*\n\n```\n{result}\n```",
-            parse_mode="Markdown",
-        )
+        """Handle /apps command - list managed applications."""
+        await _md_reply(update.message, self._format_app_list())
 
     @require_auth
     async def logs_command(
@@ -215,17 +302,20 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /logs command - show recent logs."""
-        args = context.args or []
+        args = context.args or _EMPTY_ARGS
 
         # Parse arguments: /logs [app] [backend|frontend]
         app_name = None
         service = "backend"
 
-        for arg in args:
-            if arg.lower() in ("backend", "frontend"):
-                service = arg.lower()
+        if args:
+            last = args[-1].lower()
+            if last in _SERVICES:
+                service = last
+                if len(args) > 1:
+                    app_name = args[0]
             else:
-                app_name = arg
+                app_name = args[0]
 
         try:
             app = self.app_registry.get(app_name)
@@ -233,45 +323,24 @@ _Note: If [app] is omitted, the default app is used._
             await update.message.reply_text(f"Error: {e}")
             return
 
-        await update.message.reply_text(
-            f"Fetching {service} logs for `{app.name}`...",
-            parse_mode="Markdown",
+        ack = asyncio.create_task(
+            update.message.reply_text(f"Fetching {service} logs for {app.name}...")
         )
-
-        result = await self.executor.get_logs(app, service=service)
+        try:
+            result = await self.executor.get_logs(app, service=service)
+        except BaseException:
+            ack.cancel()
+            raise
 
         if result.success:
-            await update.message.reply_text(
-                f"*Logs: {app.name} ({service})*\n\n```\n{result.output}\n```",
-                parse_mode="Markdown",
+            await _finish_ack(
+                ack,
+                update.message,
+                f"*Logs: {app.name} ({service})*\n\n```\n{result.text}\n```",
+                _MD,
             )
         else:
-            await update.message.reply_text(f"❌ Error: {result.error}")
-
-    @require_auth
-    async def build_command(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-    ) -> None:
-        """Handle /build command - build application."""
-        app_name = self._get_app_name(context.args)
-
-        try:
-            app = self.app_registry.get(app_name)
-        except AppNotFoundError as e:
-            await update.message.reply_text(f"Error: {e}")
-            return
-
-        await update.message.reply_text(f"Building `{app.name}`...", parse_mode="Markdown")
-
-        result = await self.executor.run(app, "build")
-
-        status_icon = "✅" if result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Build: {app.name}*\n\n```\n{result}\n```",
-            parse_mode="Markdown",
-        )
+            await _finish_ack(ack, update.message, f"❌ Error: {result.error}")
 
     @require_admin
     async def update_command(
@@ -288,49 +357,48 @@ _Note: If [app] is omitted, the default app is used._
             await update.message.reply_text(f"Error: {e}")
             return
 
-        await update.message.reply_text(
-            f"Updating `{app.name}`...\n\n1️⃣ Running git fetch...",
-            parse_mode="Markdown",
-        )
-
-        # Git fetch
-        fetch_result = await self.executor.git_fetch(app)
-
-        if not fetch_result.success:
-            await update.message.reply_text(
-                f"❌ *Git fetch failed:*\n\n```\n{fetch_result}\n```",
-                parse_mode="Markdown",
+        # Steps and the final result are reported by editing a single message
+        header = f"Updating `{app.name}`...\n\n"
+        progress = await _md_reply(update.message, f"{header}1️⃣ Running git fetch...")
+
+        async with self._app_locks[app.name]:
+            # Git fetch
+            fetch_result = await self.executor.git_fetch(app)
+
+            if not fetch_result.success:
+                await progress.edit_text(
+                    f"❌ *Git fetch failed:*\n\n```\n{fetch_result}\n```",
+                    parse_mode=_MD,
+                )
+                return
+
+            # Git pull, overlapped with the progress edit
+            pull_result = await _edit_while(
+                progress,
+                f"{header}✅ Git fetch complete\n2️⃣ Running git pull...",
+                self.executor.git_pull(app),
             )
-            return
-
-        await update.message.reply_text(
-            f"✅ Git fetch complete\n\n2️⃣ Running git pull...",
-            parse_mode="Markdown",
-        )
-
-        # Git pull
-        pull_result = await self.executor.git_pull(app)
 
-        if not pull_result.success:
-            await update.message.reply_text(
-                f"❌ *Git pull failed:*\n\n```\n{pull_result}\n```",
-                parse_mode="Markdown",
+            if not pull_result.success:
+                await progress.edit_text(
+                    f"❌ *Git pull failed:*\n\n```\n{pull_result}\n```",
+                    parse_mode=_MD,
+                )
+                return
+
+            # Restart, overlapped with the progress edit
+            restart_result = await _edit_while(
+                progress,
+                f"{header}✅ Git fetch complete\n"
+                f"✅ Git pull complete:\n```\n{pull_result.text}\n```\n\n3️⃣ Restarting...",
+                self.executor.run(app, "restart"),
             )
-            return
-
-        await update.message.reply_text(
-            f"✅ Git pull complete:\n```\n{pull_result.output}\n```\n\n3️⃣ Restarting...",
-            parse_mode="Markdown",
-        )
+            self._invalidate_status(app.name)
 
-        # Restart
-        restart_result = await self.executor.run(app, "restart")
-
-        status_icon = "✅" if restart_result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Update complete: {app.name}*\n\n```\n{restart_result}\n```",
-            parse_mode="Markdown",
-        )
+            await progress.edit_text(
+                _format_result(restart_result.success, "Update complete", app.name, restart_result),
+                parse_mode=_MD,
+            )
 
     @require_admin
     async def branch_command(
@@ -339,7 +407,7 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /branch command - switch git branch (admin only)."""
-        args = context.args or []
+        args = context.args or _EMPTY_ARGS
 
         if len(args) < 1:
             await update.message.reply_text(
@@ -359,21 +427,22 @@ _Note: If [app] is omitted, the default app is used._
             await update.message.reply_text(f"Error: {e}")
             return
 
-        await update.message.reply_text(
+        progress = await _md_reply(
+            update.message,
             f"Fetching and switching `{app.name}` to branch `{branch_name}`...",
-            parse_mode="Markdown",
         )
 
-        # Fetch first to ensure we have the latest remote branches
-        await self.executor.git_fetch(app)
+        async with self._app_locks[app.name]:
+            # Fetch first to ensure we have the latest remote branches
+            await self.executor.git_fetch(app)
 
-        result = await self.executor.git_checkout(app, branch_name)
+            result = await self.executor.git_checkout(app, branch_name)
+            self._invalidate_status(app.name)
 
-        status_icon = "✅" if result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Branch switch: {app.name}*\n\n```\n{result}\n```",
-            parse_mode="Markdown",
-        )
+            await progress.edit_text(
+                _format_result(result.success, "Branch switch", app.name, result),
+                parse_mode=_MD,
+            )
 
     @require_admin
     async def rollback_command(
@@ -382,7 +451,7 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /rollback - reset X commits and restart app (admin only)."""
-        args = context.args or []
+        args = context.args or _EMPTY_ARGS
 
         if len(args) < 1:
             await update.message.reply_text(
@@ -409,34 +478,35 @@ _Note: If [app] is omitted, the default app is used._
             await update.message.reply_text(f"Error: {e}")
             return
 
-        await update.message.reply_text(
-            f"Rolling back `{app.name}` by {commits} commit(s)...\n\n"
-            f"1️⃣ Running `git reset --hard HEAD~{commits}`...",
-            parse_mode="Markdown",
+        header = f"Rolling back `{app.name}` by {commits} commit(s)...\n\n"
+        progress = await _md_reply(
+            update.message,
+            f"{header}1️⃣ Running `git reset --hard HEAD~{commits}`...",
         )
 
-        result = await self.executor.git_reset(app.path, commits)
+        async with self._app_locks[app.name]:
+            result = await self.executor.git_reset(app.path, commits)
 
-        if not result.success:
-            await update.message.reply_text(
-                f"❌ *Git reset failed:*\n\n```\n{result}\n```",
-                parse_mode="Markdown",
-            )
-            return
-
-        await update.message.reply_text(
-            f"✅ Git reset complete:\n```\n{result.output}\n```\n\n"
-            "2️⃣ Restarting...",
-            parse_mode="Markdown",
-        )
+            if not result.success:
+                await progress.edit_text(
+                    f"❌ *Git reset failed:*\n\n```\n{result}\n```",
+                    parse_mode=_MD,
+                )
+                return
 
-        restart_result = await self.executor.run(app, "restart")
+            restart_result = await _edit_while(
+                progress,
+                f"{header}✅ Git reset complete:\n```\n{result.text}\n```\n\n2️⃣ Restarting...",
+                self.executor.run(app, "restart"),
+            )
+            self._invalidate_status(app.name)
 
-        status_icon = "✅" if restart_result.success else "❌"
-        await update.message.reply_text(
-            f"{status_icon} *Rollback complete: {app.name}*\n\n```\n{restart_result}\n```",
-            parse_mode="Markdown",
-        )
+            await progress.edit_text(
+                _format_result(
+                    restart_result.success, "Rollback complete", app.name, restart_result
+                ),
+                parse_mode=_MD,
+            )
 
     @require_admin
     async def self_rollback_command(
@@ -445,7 +515,7 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /self_rollback - reset X commits and restart (admin only)."""
-        args = context.args or []
+        args = context.args or _EMPTY_ARGS
 
         if len(args) < 1:
             await update.message.reply_text(
@@ -463,28 +533,29 @@ _Note: If [app] is omitted, the default app is used._
             await update.message.reply_text("Error: Please provide a valid positive number.")
             return
 
-        await update.message.reply_text(
-            f"Rolling back {commits} commit(s)...\n\n"
-            f"1️⃣ Running `git reset --hard HEAD~{commits}`...",
-            parse_mode="Markdown",
+        header = f"Rolling back {commits} commit(s)...\n\n"
+        progress = await _md_reply(
+            update.message,
+            f"{header}1️⃣ Running `git reset --hard HEAD~{commits}`...",
         )
 
-        result = await self.executor.git_reset(self.settings.bot_dir, commits)
+        async with self._self_lock:
+            result = await self.executor.git_reset(self.settings.bot_dir, commits)
 
-        if not result.success:
-            await update.message.reply_text(
-                f"❌ *Git reset failed:*\n\n```\n{result}\n```",
-                parse_mode="Markdown",
-            )
-            return
+            if not result.success:
+                await progress.edit_text(
+                    f"❌ *Git reset failed:*\n\n```\n{result}\n```",
+                    parse_mode=_MD,
+                )
+                return
 
-        await update.message.reply_text(
-            f"✅ Git reset complete:\n```\n{result.output}\n```\n\n"
-            "2️⃣ Restarting in 2 seconds...",
-            parse_mode="Markdown",
-        )
+            await progress.edit_text(
+                f"{header}✅ Git reset complete:\n```\n{result.text}\n```\n\n"
+                "2️⃣ Restarting in 2 seconds...",
+                parse_mode=_MD,
+            )
 
-        self.executor.self_restart(self.settings.bot_script)
+            await self.executor.self_restart(self.settings.bot_script)
 
     @require_admin
     async def self_logs_command(
@@ -493,20 +564,14 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /self_logs - show this bot's logs (admin only)."""
-        await update.message.reply_text(
-            "Fetching bot logs...",
-            parse_mode="Markdown",
-        )
+        progress = await update.message.reply_text("Fetching bot logs...")
 
         result = await self.executor.read_log_file(self.settings.bot_log)
 
         if result.success:
-            await update.message.reply_text(
-                f"*Bot Logs:*\n\n```\n{result.output}\n```",
-                parse_mode="Markdown",
-            )
+            await progress.edit_text(f"*Bot Logs:*\n\n```\n{result.text}\n```", parse_mode=_MD)
         else:
-            await update.message.reply_text(f"❌ Error: {result.error}")
+            await progress.edit_text(f"❌ Error: {result.error}")
 
     @require_admin
     async def self_restart_command(
@@ -515,12 +580,10 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /self_restart - restart this bot (admin only)."""
-        await update.message.reply_text(
-            "Restarting bot in 2 seconds...",
-            parse_mode="Markdown",
-        )
+        await update.message.reply_text("Restarting bot in 2 seconds...")
 
-        self.executor.self_restart(self.settings.bot_script)
+        async with self._self_lock:
+            await self.executor.self_restart(self.settings.bot_script)
 
     @require_admin
     async def self_update_command(
@@ -529,24 +592,23 @@ _Note: If [app] is omitted, the default app is used._
         context: ContextTypes.DEFAULT_TYPE,
     ) -> None:
         """Handle /self_update - git pull and restart this bot (admin only)."""
-        await update.message.reply_text(
-            "Updating bot...\n\n1️⃣ Running git pull...",
-            parse_mode="Markdown",
-        )
-
-        result = await self.executor.self_update(
-            self.settings.bot_dir,
-            self.settings.bot_script,
-        )
+        progress = await update.message.reply_text("Updating bot...\n\n1️⃣ Running git pull...")
 
-        if result.success:
-            await update.message.reply_text(
-                f"✅ Git pull complete:\n```\n{result.output}\n```\n\n"
-                "2️⃣ Restarting in 2 seconds...",
-                parse_mode="Markdown",
-            )
-        else:
-            await update.message.reply_text(
-                f"❌ *Git pull failed:*\n\n```\n{result}\n```",
-                parse_mode="Markdown",
+        async with self._self_lock:
+            result = await self.executor.self_update(
+                self.settings.bot_dir,
+                self.settings.bot_script,
             )
+
+            if result.success:
+                await progress.edit_text(
+                    "Updating bot...\n\n"
+                    f"✅ Git pull complete:\n```\n{result.text}\n```\n\n"
+                    "2️⃣ Restarting in 2 seconds...",
+                    parse_mode=_MD,
+                )
+            else:
+                await progress.edit_text(
+                    f"❌ *Git pull failed:*\n\n```\n{result}\n```",
+                    parse_mode=_MD,
+                )
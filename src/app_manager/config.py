@@ -1,6 +1,8 @@
 """Configuration management using pydantic-settings."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Any
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -41,29 +43,63 @@ class Settings(BaseSettings):
         description="Telegram user IDs allowed to use the bot (comma-separated)",
     )
 
+    # Polling
+    poll_timeout: int = Field(
+        default=30,
+        description="Long-poll timeout in seconds for getUpdates",
+    )
+
+    # Webhook mode (polling is used when webhook_url is empty)
+    webhook_url: str = Field(
+        default="",
+        description="Public base URL Telegram should POST updates to",
+    )
+    webhook_listen: str = Field(default="0.0.0.0", description="Webhook listen address")
+    webhook_port: int = Field(default=8443, description="Webhook listen port")
+
     # Apps Configuration
     apps_config_path: str = Field(
         default="apps.yaml",
         description="Path to apps configuration file",
     )
 
+    # Seconds a /status result is reused for repeat requests (0 disables)
+    status_cache_ttl: float = Field(
+        default=3.0,
+        description="Seconds to reuse a /status result",
+    )
+
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
+    log_format: str = Field(
+        default="console",
+        description="Log output format: console or json",
+    )
+    audit_log_enabled: bool = Field(
+        default=True,
+        description="Log every authorized command (audit trail)",
+    )
 
-    @property
-    def admin_ids(self) -> list[int]:
-        """Get admin user IDs as list."""
-        return parse_comma_separated_ints(self.admin_user_ids)
+    # The ID sets are parsed once and then stored in the instance __dict__
+    # (cached_property), which reads far faster than pydantic private attrs
+    def model_post_init(self, __context: Any) -> None:
+        """Parse the user ID strings up front, so invalid IDs fail at load time."""
+        _ = self.all_authorized_users
 
-    @property
-    def allowed_ids(self) -> list[int]:
-        """Get allowed user IDs as list."""
-        return parse_comma_separated_ints(self.allowed_user_ids)
+    @cached_property
+    def admin_ids(self) -> frozenset[int]:
+        """Get admin user IDs."""
+        return frozenset(parse_comma_separated_ints(self.admin_user_ids))
 
-    @property
-    def all_authorized_users(self) -> set[int]:
+    @cached_property
+    def allowed_ids(self) -> frozenset[int]:
+        """Get allowed user IDs."""
+        return frozenset(parse_comma_separated_ints(self.allowed_user_ids))
+
+    @cached_property
+    def all_authorized_users(self) -> frozenset[int]:
         """Get all authorized user IDs (admins + allowed users)."""
-        return set(self.admin_ids) | set(self.allowed_ids)
+        return self.admin_ids | self.allowed_ids
 
     def is_admin(self, user_id: int) -> bool:
         """Check if user is an admin."""
@@ -91,6 +127,11 @@ class Settings(BaseSettings):
         return Path("/tmp/app-manager-bot.log")
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    Settings are loaded once and shared; call get_settings.cache_clear()
+    to force a reload (e.g. in tests).
+    """
     return Settings()
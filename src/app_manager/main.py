@@ -1,6 +1,8 @@
 """Application Manager Bot - Main entry point."""
 
 import asyncio
+import os
+import signal
 import sys
 from pathlib import Path
 
@@ -8,38 +10,71 @@ import structlog
 from telegram.ext import Application, CommandHandler
 
 from app_manager.apps import AppRegistry
-from app_manager.bot import BotHandlers
+from app_manager.bot import BotHandlers, configure_auth_logging
 from app_manager.config import get_settings
 from app_manager.utils import setup_logging
 
 logger = structlog.get_logger()
 
+# (command, BotHandlers method) pairs registered by create_application()
+_COMMANDS = (
+    ("start", "start_command"),
+    ("help", "help_command"),
+    ("apps", "apps_command"),
+    ("status", "status_command"),
+    ("app_start", "app_start_command"),
+    ("app_stop", "app_stop_command"),
+    ("app_restart", "app_restart_command"),
+    ("logs", "logs_command"),
+    ("build", "build_command"),
+    ("update", "update_command"),
+    ("branch", "branch_command"),
+    ("rollback", "rollback_command"),
+    ("self_rollback", "self_rollback_command"),
+    ("self_logs", "self_logs_command"),
+    ("self_restart", "self_restart_command"),
+    ("self_update", "self_update_command"),
+)
+
+
+def install_child_watcher() -> None:
+    """Use the pidfd-based child watcher on Python 3.11 when the kernel supports it.
+
+    The 3.11 default (ThreadedChildWatcher) starts a thread per subprocess;
+    3.12+ already selects the pidfd watcher by default. Must be called from
+    within the running event loop.
+    """
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        # Kernel older than 5.3 or pidfd blocked (e.g. seccomp)
+        return
+
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    asyncio.set_child_watcher(watcher)
+
 
 def create_application(settings, app_registry) -> Application:
     """Create and configure the Telegram application."""
     # Create handlers
     handlers = BotHandlers(settings, app_registry)
 
-    # Build application
-    app = Application.builder().token(settings.telegram_bot_token).build()
+    # Build application; updates from different users are handled concurrently
+    app = (
+        Application.builder()
+        .token(settings.telegram_bot_token)
+        .concurrent_updates(True)
+        .build()
+    )
 
     # Register command handlers
-    app.add_handler(CommandHandler("start", handlers.start_command))
-    app.add_handler(CommandHandler("help", handlers.help_command))
-    app.add_handler(CommandHandler("apps", handlers.apps_command))
-    app.add_handler(CommandHandler("status", handlers.status_command))
-    app.add_handler(CommandHandler("app_start", handlers.app_start_command))
-    app.add_handler(CommandHandler("app_stop", handlers.app_stop_command))
-    app.add_handler(CommandHandler("app_restart", handlers.app_restart_command))
-    app.add_handler(CommandHandler("logs", handlers.logs_command))
-    app.add_handler(CommandHandler("build", handlers.build_command))
-    app.add_handler(CommandHandler("update", handlers.update_command))
-    app.add_handler(CommandHandler("branch", handlers.branch_command))
-    app.add_handler(CommandHandler("rollback", handlers.rollback_command))
-    app.add_handler(CommandHandler("self_rollback", handlers.self_rollback_command))
-    app.add_handler(CommandHandler("self_logs", handlers.self_logs_command))
-    app.add_handler(CommandHandler("self_restart", handlers.self_restart_command))
-    app.add_handler(CommandHandler("self_update", handlers.self_update_command))
+    app.add_handlers(
+        [CommandHandler(command, getattr(handlers, attr)) for command, attr in _COMMANDS]
+    )
 
     return app
 
@@ -50,12 +85,18 @@ async def run_bot() -> None:
     settings = get_settings()
 
     # Setup logging
-    setup_logging(settings.log_level)
+    setup_logging(settings.log_level, settings.log_format)
+    configure_auth_logging(
+        debug=settings.log_level.upper() == "DEBUG",
+        audit=settings.audit_log_enabled,
+    )
+
+    install_child_watcher()
 
     logger.info(
         "Starting Application Manager Bot",
-        admin_count=len(settings.admin_user_ids),
-        allowed_count=len(settings.allowed_user_ids),
+        admin_count=len(settings.admin_ids),
+        allowed_count=len(settings.allowed_ids),
     )
 
     # Load app registry
@@ -66,15 +107,15 @@ async def run_bot() -> None:
 
     app_registry = AppRegistry()
     try:
-        app_registry.load_from_yaml(config_path)
+        await app_registry.load_from_yaml_async(config_path)
     except FileNotFoundError:
         logger.error(
             "Apps configuration file not found",
             config_path=str(config_path),
         )
         sys.exit(1)
-    except Exception as e:
-        logger.exception("Failed to load apps configuration", error=str(e))
+    except Exception:
+        logger.exception("Failed to load apps configuration")
         sys.exit(1)
 
     logger.info(
@@ -87,17 +128,38 @@ async def run_bot() -> None:
     # Create and run application
     app = create_application(settings, app_registry)
 
-    logger.info("Bot is ready, starting polling...")
+    # SIGINT/SIGTERM request a clean shutdown; the loop sleeps until then
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
 
     # Run the bot
     await app.initialize()
     await app.start()
-    await app.updater.start_polling(drop_pending_updates=True)
+    if settings.webhook_url:
+        logger.info("Bot is ready, starting webhook...", port=settings.webhook_port)
+        # The token doubles as an unguessable URL path
+        await app.updater.start_webhook(
+            listen=settings.webhook_listen,
+            port=settings.webhook_port,
+            url_path=settings.telegram_bot_token,
+            webhook_url=f"{settings.webhook_url.rstrip('/')}/{settings.telegram_bot_token}",
+            drop_pending_updates=True,
+        )
+    else:
+        logger.info("Bot is ready, starting polling...")
+        # Long polling: Telegram holds getUpdates open until an update arrives
+        await app.updater.start_polling(
+            drop_pending_updates=True,
+            poll_interval=0.0,
+            timeout=settings.poll_timeout,
+            bootstrap_retries=-1,
+        )
 
-    # Keep running until interrupted
+    # Keep running until a stop signal arrives
     try:
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
     except asyncio.CancelledError:
         pass
     finally:
@@ -113,8 +175,8 @@ def main() -> None:
         asyncio.run(run_bot())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
-    except Exception as e:
-        logger.exception("Bot crashed", error=str(e))
+    except Exception:
+        logger.exception("Bot crashed")
         sys.exit(1)
 
 
@@ -1,34 +1,192 @@
 """Logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
 import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import PurePath
 
 import structlog
 
+# orjson is optional; JSON output falls back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Configure structured logging."""
-    # Set up standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
+
+class _EnqueueHandler(QueueHandler):
+    """Queue handler that hands records over untouched.
+
+    The default QueueHandler formats the record on the calling thread,
+    which is exactly the work we want the listener thread to do.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Audit trail events (AUDIT_LOG_ENABLED); these must never be sampled away
+_UNSAMPLED_EVENTS = frozenset(("Authorized command", "Admin command executed"))
+
+
+class _RateLimiter:
+    """Processor that thins out debug/info events under burst traffic.
+
+    Each (event, level) pair may emit at most ``limit`` records per
+    ``window`` seconds; debug events are additionally sampled 1 in
+    ``debug_sample``. Warnings, errors and the events in ``exempt``
+    always pass.
+    """
+
+    def __init__(
+        self,
+        limit: int = 20,
+        window: float = 5.0,
+        debug_sample: int = 10,
+        exempt: frozenset[str] = _UNSAMPLED_EVENTS,
+    ):
+        self.limit = limit
+        self.window = window
+        self.debug_sample = debug_sample
+        self.exempt = exempt
+        self._windows: dict[tuple[str, str], tuple[float, int]] = {}
+
+    def __call__(self, logger, method_name, event_dict):
+        if method_name not in ("debug", "info"):
+            return event_dict
+
+        event = event_dict.get("event")
+        if event in self.exempt:
+            return event_dict
+
+        key = (event, method_name)
+        now = time.monotonic()
+        start, count = self._windows.get(key, (now, 0))
+        if now - start >= self.window:
+            start, count = now, 0
+        count += 1
+        self._windows[key] = (start, count)
+
+        if method_name == "debug":
+            if (count - 1) % self.debug_sample:
+                raise structlog.DropEvent
+            count = (count - 1) // self.debug_sample + 1
+        if count > self.limit:
+            raise structlog.DropEvent
+        return event_dict
+
+
+def _capture_exc_info(logger, method_name, event_dict):
+    """Resolve exc_info=True while still on the thread handling the exception."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def _stamp_record_time(logger, method_name, event_dict):
+    """Stamp a stdlib record with the time it was logged.
+
+    Foreign records reach the formatter on the listener thread, so a
+    TimeStamper there would record when they were rendered instead.
+    """
+    created = event_dict["_record"].created
+    event_dict["timestamp"] = (
+        datetime.fromtimestamp(created, tz=timezone.utc).isoformat().replace("+00:00", "Z")
     )
+    return event_dict
+
+
+def _render_values(logger, method_name, event_dict):
+    """Turn argv lists and paths into plain strings for display.
+
+    Runs inside the formatter, so the work is only done for records that
+    are actually emitted, and on the listener thread.
+    """
+    for key, value in event_dict.items():
+        if key == "cmd" and isinstance(value, (list, tuple)):
+            event_dict[key] = " ".join(value)
+        elif isinstance(value, PurePath):
+            event_dict[key] = str(value)
+    return event_dict
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """orjson-backed serializer for JSONRenderer (handlers expect str)."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
+
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    if orjson is not None:
+        return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    return structlog.processors.JSONRenderer()
+
+
+def setup_logging(log_level: str = "INFO", log_format: str = "console") -> None:
+    """Configure structured logging.
+
+    Log calls only enqueue the record; rendering and writing to stdout
+    happen on a background QueueListener thread so they stay off the
+    event loop. The listener is stopped (and drained) at interpreter exit.
+
+    log_format is "console" for coloured human-readable output or "json"
+    for one JSON object per line (encoded with orjson when installed).
+    """
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
+    if log_format.lower() == "json":
+        render_chain = [structlog.processors.format_exc_info, _json_renderer()]
+    else:
+        render_chain = [structlog.dev.ConsoleRenderer(colors=True)]
+
+    # Real output handler, driven by the listener thread. Records from plain
+    # stdlib loggers (python-telegram-bot, httpx) get level and timestamp
+    # added there too, so they render like structlog events; the timestamp
+    # comes from the record, since rendering may lag behind the log call.
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=[
+                structlog.processors.add_log_level,
+                _stamp_record_time,
+            ],
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                _render_values,
+                *render_chain,
+            ],
+        )
+    )
+
+    # Unbounded lock-free queue: enqueueing never blocks the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    # Set up standard logging
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_EnqueueHandler(log_queue)]
+    root_logger.setLevel(level)
 
     # Configure structlog
     structlog.configure(
         processors=[
+            _RateLimiter(),
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
+            _capture_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=True),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+
+    listener.start()
+    atexit.register(listener.stop)
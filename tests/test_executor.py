@@ -0,0 +1,45 @@
+"""Tests for the executor's log tail reader."""
+
+import pytest
+
+from app_manager.apps.executor import _tail_bytes
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"".join(b"line %d\n" % i for i in range(100)))
+    return path
+
+
+def test_returns_last_lines(log_file):
+    assert _tail_bytes(log_file, 3, 4096) == b"line 97\nline 98\nline 99\n"
+
+
+def test_without_trailing_newline(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"a\nb\nc")
+    assert _tail_bytes(path, 2, 4096) == b"b\nc"
+
+
+def test_short_file_is_returned_whole(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"a\nb\n")
+    assert _tail_bytes(path, 10, 4096) == b"a\nb\n"
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"")
+    assert _tail_bytes(path, 5, 4096) == b""
+
+
+def test_no_lines_requested(log_file):
+    assert _tail_bytes(log_file, 0, 4096) == b""
+
+
+def test_read_is_bounded_by_max_bytes(tmp_path):
+    # Lines longer than max_bytes: only the end of the file is read
+    path = tmp_path / "app.log"
+    path.write_bytes(b"x" * 5000 + b"\n" + b"y" * 5000 + b"\n")
+    assert _tail_bytes(path, 2, 100) == b"y" * 99 + b"\n"
@@ -0,0 +1,131 @@
+"""Tests for the /status cache and result rendering in BotHandlers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegram.constants import MessageLimit
+
+from app_manager.apps import AppRegistry
+from app_manager.apps.executor import ExecutionResult
+from app_manager.apps.models import AppConfig
+from app_manager.bot.handlers import _TRUNCATED_MARKER, BotHandlers, _format_result
+from app_manager.config import Settings
+
+ADMIN_ID = 1
+
+
+class FakeExecutor:
+    """Records run() calls; each call blocks until `release` is set."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.release = asyncio.Event()
+        self.errors: list[Exception] = []
+
+    async def run(self, app, action, extra_args=None):
+        self.calls.append(action)
+        await self.release.wait()
+        if self.errors:
+            raise self.errors.pop(0)
+        return ExecutionResult(success=True, output=f"{action} ok", return_code=0)
+
+
+@pytest.fixture
+def executor():
+    return FakeExecutor()
+
+
+@pytest.fixture
+def app(tmp_path):
+    return AppConfig(name="web", path=tmp_path)
+
+
+@pytest.fixture
+def handlers(executor, app):
+    settings = Settings(
+        _env_file=None,
+        telegram_bot_token="test",
+        admin_user_ids=str(ADMIN_ID),
+        status_cache_ttl=60,
+    )
+    registry = AppRegistry()
+    registry.apps = {app.name: app}
+    registry.default_app = app.name
+    return BotHandlers(settings, registry, executor)
+
+
+def _command(*args):
+    """Build an (update, context) pair for an admin sending a command."""
+    update = MagicMock()
+    update.effective_user.id = ADMIN_ID
+    update.message.reply_text = AsyncMock(return_value=MagicMock(edit_text=AsyncMock()))
+    context = MagicMock()
+    context.args = list(args)
+    return update, context
+
+
+async def test_concurrent_status_calls_share_one_run(handlers, executor, app):
+    waiters = [asyncio.ensure_future(handlers._get_status(app)) for _ in range(3)]
+    await asyncio.sleep(0)
+    executor.release.set()
+
+    results = await asyncio.gather(*waiters)
+    assert executor.calls == ["status"]
+    assert all(result is results[0] for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_run(handlers, executor, app):
+    first = asyncio.ensure_future(handlers._get_status(app))
+    second = asyncio.ensure_future(handlers._get_status(app))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    executor.release.set()
+
+    result = await second
+    assert result.success
+    assert first.cancelled()
+
+    # The shared run stays cached and is reused
+    assert await handlers._get_status(app) is result
+    assert executor.calls == ["status"]
+
+
+async def test_failed_run_is_evicted(handlers, executor, app):
+    executor.errors.append(RuntimeError("boom"))
+    executor.release.set()
+
+    with pytest.raises(RuntimeError):
+        await handlers._get_status(app)
+    assert app.name not in handlers._status_cache
+
+    result = await handlers._get_status(app)
+    assert result.success
+    assert executor.calls == ["status", "status"]
+
+
+@pytest.mark.parametrize("command", ["app_start_command", "app_stop_command"])
+async def test_state_change_invalidates_status(handlers, executor, app, command):
+    executor.release.set()
+    await handlers._get_status(app)
+
+    await getattr(handlers, command)(*_command(app.name))
+    assert app.name not in handlers._status_cache
+
+    await handlers._get_status(app)
+    assert executor.calls == ["status", command.split("_")[1], "status"]
+
+
+def test_format_result_renders_template():
+    assert _format_result(True, "Start", "web", "ok") == "✅ *Start: web*\n\n```\nok\n```"
+    assert _format_result(False, "Stop", "web", "no") == "❌ *Stop: web*\n\n```\nno\n```"
+
+
+def test_format_result_keeps_tail_within_message_limit():
+    result = "".join(f"line {i}\n" for i in range(2000)) + "last line"
+    text = _format_result(True, "Build", "web", result)
+
+    assert len(text) == MessageLimit.MAX_TEXT_LENGTH
+    assert text.startswith("✅ *Build: web*\n\n```\n" + _TRUNCATED_MARKER)
+    assert text.endswith("last line\n```")